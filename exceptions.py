@@ -2,6 +2,8 @@
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
+
+    __slots__ = ("provider", "code", "raw_error")
     
     def __init__(
         self,
@@ -6,15 +6,21 @@ from models.base import (
     FunctionParameter, Function, FunctionCall,
     Usage, ResponseMetadata, LLMError,
     # Chat
-    ChatRequest, ChatResponse, ChatStreamResponse,
+    ChatRequest, ChatResponse, ChatStreamResponse, ChatStreamAccumulator,
     # Embeddings
     EmbeddingRequest, EmbeddingResponse, EmbeddingData,
     # Speech
     Voice, AudioFormat, SpeechRequest, SpeechResponse,
+    # Serialization
+    dump,
 )
 
 from models.capabilities import (
+    CapabilityProvider,
     ChatProvider,
     EmbeddingProvider,
     SpeechProvider,
-)
\ No newline at end of file
+)
+
+# Registers the built-in chat response converters
+import models._converters
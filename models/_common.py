@@ -0,0 +1,14 @@
+"""Shared base for provider wire models."""
+
+import pydantic
+
+class BaseModel(pydantic.BaseModel):
+    """Base for provider request/response models.
+
+    Provider APIs add response fields over time, so unknown keys are
+    ignored. Keep per-provider model configuration here, in one place.
+    """
+
+    model_config = {
+        "extra": "ignore"
+    }
@@ -0,0 +1,107 @@
+"""Chat response converters for the built-in provider response models.
+
+Registered with models.capabilities on import, so the capability
+interfaces do not depend on concrete provider models.
+"""
+
+import typing
+
+import pydantic_core
+
+import models.anthropic as anthropic
+import models.base as base
+import models.capabilities as capabilities
+import models.openai as openai
+
+def _convert_tool_call(call: dict[str, typing.Any]) -> base.FunctionCall:
+    """Convert provider tool call to universal function call.
+
+    Accepts both the OpenAI shape (``function`` with JSON-encoded
+    ``arguments``) and the Anthropic shape (``name`` with ``input``).
+    """
+    function = call.get("function", call)
+    arguments = function.get("arguments", function.get("input"))
+    if isinstance(arguments, str):
+        arguments = pydantic_core.from_json(arguments) if arguments else {}
+    return base.FunctionCall.model_construct(
+        name=function["name"],
+        arguments=arguments or {}
+    )
+
+@capabilities.register_chat_response_converter(anthropic.MessageResponse)
+def _convert_anthropic_response(
+    response: anthropic.MessageResponse,
+    request: base.ChatRequest,
+    raw_body: bytes | None = None
+) -> base.ChatResponse:
+    """Convert Anthropic message response to universal format."""
+    usage = response.usage
+    function_calls = [
+        base.FunctionCall.model_construct(
+            name=block.name,
+            arguments=block.input or {}
+        )
+        for block in response.content
+        if block.type == "tool_use"
+    ]
+    if response.tool_calls:
+        function_calls.extend(map(_convert_tool_call, response.tool_calls))
+    return base.ChatResponse.model_construct(
+        id=response.id,
+        content=[
+            base.Content.model_construct(type="text", text=block.text)
+            for block in response.content
+            if block.type == "text"
+        ],
+        function_calls=function_calls or None,
+        metadata=base.ResponseMetadata.model_construct(
+            model=response.model,
+            usage=base.Usage.model_construct(
+                prompt_tokens=usage.input_tokens,
+                completion_tokens=usage.output_tokens,
+                total_tokens=usage.input_tokens + usage.output_tokens
+            ),
+            finish_reason=response.stop_reason,
+            raw_response_bytes=raw_body
+        )
+    )
+
+@capabilities.register_chat_response_converter(openai.ChatCompletionResponse)
+def _convert_openai_response(
+    response: openai.ChatCompletionResponse,
+    request: base.ChatRequest,
+    raw_body: bytes | None = None
+) -> base.ChatResponse:
+    """Convert OpenAI chat completion response to universal format."""
+    choice = response.choices[0]
+    message = choice.message
+    usage = response.usage
+    function_calls = [
+        _convert_tool_call(call)
+        for call in message.tool_calls or ()
+        if call.get("type", "function") == "function"
+    ]
+    if message.function_call:
+        function_calls.append(
+            base.FunctionCall.model_construct(
+                name=message.function_call.name,
+                arguments=pydantic_core.from_json(message.function_call.arguments)
+            )
+        )
+    return base.ChatResponse.model_construct(
+        id=response.id,
+        content=[
+            base.Content.model_construct(type="text", text=message.content)
+        ] if isinstance(message.content, str) else [],
+        function_calls=function_calls or None,
+        metadata=base.ResponseMetadata.model_construct(
+            model=response.model,
+            usage=base.Usage.model_construct(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                total_tokens=usage.total_tokens
+            ),
+            finish_reason=choice.finish_reason,
+            raw_response_bytes=raw_body
+        )
+    )
@@ -0,0 +1,25 @@
+"""Shared function (tool) schema definitions.
+
+Function definitions are JSON Schema documents that are forwarded to
+providers as is, so every model module shares these TypedDicts instead of
+defining its own BaseModel tree.
+"""
+
+import typing
+
+import typing_extensions
+
+class FunctionParameter(typing_extensions.TypedDict, total=False):
+    """Function parameter definition (JSON Schema subset)."""
+    type: typing.Required[str]
+    description: str
+    enum: list[str]
+    items: dict[str, typing.Any]
+    properties: dict[str, 'FunctionParameter']
+    required: list[str]
+
+class FunctionSchema(typing_extensions.TypedDict):
+    """Function definition."""
+    name: str
+    description: str
+    parameters: FunctionParameter
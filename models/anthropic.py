@@ -75,46 +75,42 @@ Streaming Response Events:
 import typing
 import pydantic
 
-class MediaSource(pydantic.BaseModel):
+from models._common import BaseModel
+from models._function_schema import (
+    FunctionParameter as FunctionParameters,
+    FunctionSchema as Function,
+)
+
+class MediaSource(BaseModel):
     type: typing.Literal["base64"]
     media_type: str
     data: str
 
-class ImageContent(pydantic.BaseModel):
+class ImageContent(BaseModel):
     type: typing.Literal["image"]
     source: MediaSource
 
-class TextContent(pydantic.BaseModel):
+class TextContent(BaseModel):
     type: typing.Literal["text"]
     text: str
 
-class FileContent(pydantic.BaseModel):
+class FileContent(BaseModel):
     type: typing.Literal["file"]
     source: MediaSource
 
-class FunctionParameters(pydantic.BaseModel):
-    type: str
-    description: str | None = None
-    enum: list[str] | None = None
-    items: dict[str, typing.Any] | None = None
-    properties: dict[str, 'FunctionParameters'] | None = None
-    required: list[str] | None = None
-
-class Function(pydantic.BaseModel):
-    name: str
-    description: str
-    parameters: FunctionParameters
-
-class Tool(pydantic.BaseModel):
+class Tool(BaseModel):
     type: typing.Literal["function"]
     function: Function
 
-class Message(pydantic.BaseModel):
+class Message(BaseModel):
     role: typing.Literal["user", "assistant"]
-    content: str | list[TextContent | ImageContent | FileContent]
+    content: str | list[typing.Annotated[
+        TextContent | ImageContent | FileContent,
+        pydantic.Field(discriminator="type")
+    ]]
     tool_calls: list[dict[str, typing.Any]] | None = None
 
-class MessageRequest(pydantic.BaseModel):
+class MessageRequest(BaseModel):
     model: str
     messages: list[Message]
     system: str | None = None
@@ -127,16 +123,20 @@ class MessageRequest(pydantic.BaseModel):
     top_k: int | None = None
     system_tools: list[Tool] | None = None
 
-class Usage(pydantic.BaseModel):
+class Usage(BaseModel):
     input_tokens: int
     output_tokens: int
 
-class ContentBlock(pydantic.BaseModel):
-    type: typing.Literal["text", "image", "file"]
+class ContentBlock(BaseModel):
+    type: typing.Literal["text", "image", "file", "tool_use"]
     text: str | None = None
     source: MediaSource | None = None
+    # Tool use blocks
+    id: str | None = None
+    name: str | None = None
+    input: dict[str, typing.Any] | None = None
 
-class MessageResponse(pydantic.BaseModel):
+class MessageResponse(BaseModel):
     id: str
     type: str
     role: str
@@ -147,20 +147,20 @@ class MessageResponse(pydantic.BaseModel):
     usage: Usage
     tool_calls: list[dict[str, typing.Any]] | None = None
 
-class Delta(pydantic.BaseModel):
+class Delta(BaseModel):
     type: str | None = None
     text: str | None = None
     tool_calls: list[dict[str, typing.Any]] | None = None
     stop_reason: str | None = None
     stop_sequence: str | None = None
 
-class StreamMessage(pydantic.BaseModel):
+class StreamMessage(BaseModel):
     type: str
     delta: Delta
     usage: Usage | None = None
     index: int = 0
 
-class MessageStreamResponse(pydantic.BaseModel):
+class MessageStreamResponse(BaseModel):
     id: str
     type: typing.Literal["message_start", "content_block_start", "content_block_delta", "content_block_stop", "message_delta", "message_stop"]
     message: StreamMessage
@@ -6,8 +6,12 @@ a consistent interface.
 """
 
 import enum
+import functools
 import typing
 import pydantic
+import pydantic_core
+
+from models._function_schema import FunctionParameter, FunctionSchema as Function
 
 class ContentType(str, enum.Enum):
     """Supported content types for LLM interactions."""
@@ -26,7 +30,7 @@ class Role(str, enum.Enum):
 
 class MediaSource(pydantic.BaseModel):
     """Universal media content representation."""
-    type: ContentType
+    type: typing.Literal["text", "image", "pdf", "video", "audio"]
     mime_type: str
     # One of the following should be provided
     data: str | None = None  # base64 encoded content
@@ -39,7 +43,7 @@ class MediaSource(pydantic.BaseModel):
 
 class Content(pydantic.BaseModel):
     """Content part of the message."""
-    type: ContentType
+    type: typing.Literal["text", "image", "pdf", "video", "audio"]
     text: str | None = None
     media: MediaSource | None = None
 
@@ -47,29 +51,6 @@ class Content(pydantic.BaseModel):
         "extra": "forbid"
     }
 
-class FunctionParameter(pydantic.BaseModel):
-    """Function parameter definition."""
-    type: str
-    description: str | None = None
-    enum: list[str] | None = None
-    items: dict[str, typing.Any] | None = None
-    properties: dict[str, 'FunctionParameter'] | None = None
-    required: list[str] | None = None
-
-    model_config = {
-        "extra": "forbid"
-    }
-
-class Function(pydantic.BaseModel):
-    """Function definition."""
-    name: str
-    description: str
-    parameters: FunctionParameter
-
-    model_config = {
-        "extra": "forbid"
-    }
-
 class FunctionCall(pydantic.BaseModel):
     """Function call details."""
     name: str
@@ -82,7 +63,7 @@ class FunctionCall(pydantic.BaseModel):
 
 class Message(pydantic.BaseModel):
     """Single message in conversation."""
-    role: Role
+    role: typing.Literal["system", "user", "assistant", "function"]
     content: list[Content]
     name: str | None = None
     function_call: FunctionCall | None = None
@@ -123,7 +104,7 @@ class ChatResponse(pydantic.BaseModel):
     id: str
     content: list[Content]
     function_calls: list[FunctionCall] | None = None
-    metadata: ResponseMetadata
+    metadata: 'ResponseMetadata'
 
     model_config = {
         "extra": "forbid"
@@ -133,13 +114,60 @@ class ChatStreamResponse(pydantic.BaseModel):
     """Universal chat streaming response chunk."""
     id: str
     delta: Content | FunctionCall
-    metadata: ResponseMetadata | None = None
+    metadata: 'ResponseMetadata | None' = None
     done: bool = False
 
     model_config = {
-        "extra": "forbid"
+        "extra": "ignore"
     }
 
+class ChatStreamAccumulator:
+    """Collects streamed chunks into a single chat response.
+
+    Only the delta text of each chunk is kept, so callers that want the
+    final text do not hold a Content model per streamed token.
+    """
+
+    __slots__ = ("_id", "_text", "_function_calls", "_metadata")
+
+    def __init__(self):
+        self._id = ""
+        self._text: list[str] = []
+        self._function_calls: list[FunctionCall] = []
+        self._metadata: ResponseMetadata | None = None
+
+    def feed(self, chunk: ChatStreamResponse) -> None:
+        """Add stream chunk."""
+        self._id = chunk.id
+        delta = chunk.delta
+        if isinstance(delta, FunctionCall):
+            self._function_calls.append(delta)
+        elif delta.text:
+            self._text.append(delta.text)
+        if chunk.metadata is not None:
+            self._metadata = chunk.metadata
+
+    def finalize(self, model: str | None = None) -> ChatResponse:
+        """Build chat response from collected chunks.
+
+        ``model`` is used for minimal metadata when no chunk carried any;
+        without it that case raises ValueError.
+        """
+        metadata = self._metadata
+        if metadata is None:
+            if model is None:
+                raise ValueError("No stream chunk carried response metadata")
+            metadata = ResponseMetadata.model_construct(model=model)
+        text = "".join(self._text)
+        return ChatResponse.model_construct(
+            id=self._id,
+            content=[
+                Content.model_construct(type="text", text=text)
+            ] if text else [],
+            function_calls=self._function_calls or None,
+            metadata=metadata
+        )
+
 # Embedding Models
 class EmbeddingRequest(pydantic.BaseModel):
     """Universal embedding request."""
@@ -163,7 +191,7 @@ class EmbeddingResponse(pydantic.BaseModel):
     data: list[EmbeddingData]
     model: str
     object: typing.Literal["list"]
-    usage: Usage
+    usage: 'Usage'
 
     model_config = {
         "extra": "forbid"
@@ -189,8 +217,8 @@ class SpeechRequest(pydantic.BaseModel):
     """Universal speech synthesis request."""
     model: str
     input: str
-    voice: Voice
-    format: AudioFormat = AudioFormat.MP3
+    voice: typing.Literal["male-1", "male-2", "female-1", "female-2", "neutral"]
+    format: typing.Literal["mp3", "wav", "ogg", "flac"] = "mp3"
     speed: float = 1.0
     pitch: float | None = None
     volume: float | None = None
@@ -204,8 +232,8 @@ class SpeechResponse(pydantic.BaseModel):
     id: str
     audio: bytes
     duration: float
-    format: AudioFormat
-    metadata: ResponseMetadata
+    format: typing.Literal["mp3", "wav", "ogg", "flac"]
+    metadata: 'ResponseMetadata'
 
     model_config = {
         "extra": "forbid"
@@ -223,7 +251,7 @@ class Usage(pydantic.BaseModel):
     total_dimensions: int | None = None
 
     model_config = {
-        "extra": "forbid"
+        "extra": "ignore"
     }
 
 class ResponseMetadata(pydantic.BaseModel):
@@ -231,13 +259,44 @@ class ResponseMetadata(pydantic.BaseModel):
     model: str
     usage: Usage | None = None
     finish_reason: str | None = None
-    # Provider-specific metadata
-    raw_response: dict[str, typing.Any] | None = None
+    # Provider-specific metadata, kept as the original JSON body
+    raw_response_bytes: bytes | None = None
 
     model_config = {
-        "extra": "forbid"
+        "extra": "ignore"
     }
 
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def _reject_raw_response(cls, data: typing.Any) -> typing.Any:
+        """Fail loudly for the removed raw_response field instead of ignoring it."""
+        if isinstance(data, dict) and "raw_response" in data:
+            raise ValueError(
+                "raw_response is no longer accepted, pass the provider "
+                "response body as raw_response_bytes"
+            )
+        return data
+
+    @functools.cached_property
+    def raw_response(self) -> dict[str, typing.Any] | None:
+        """Provider response parsed on first access."""
+        if self.raw_response_bytes is None:
+            return None
+        return pydantic_core.from_json(self.raw_response_bytes)
+
+# Resolve forward references to the common models above and build the
+# validators now rather than on the first request.
+for _model in (ChatResponse, ChatStreamResponse, EmbeddingResponse, SpeechResponse):
+    _model.model_rebuild(force=True)
+
+def dump(model: pydantic.BaseModel | dict[str, typing.Any]) -> bytes:
+    """Serialize model or dict to JSON bytes for a provider request body.
+
+    Unset (None) fields are dropped from models; dicts are serialized as
+    given, None values included.
+    """
+    return pydantic_core.to_json(model, exclude_none=True)
+
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
     def __init__(
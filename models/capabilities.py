@@ -1,32 +1,126 @@
 """LLM provider capabilities and interfaces."""
 
+import abc
 import typing
 
 import models.base as base
 
-class ChatProvider(typing.Protocol):
-    """Protocol for chat completion capabilities."""
-    
-    @property
-    def name(self) -> str:
-        """Provider name."""
-        ...
-    
-    @property
-    def supported_content_types(self) -> set[base.ContentType]:
-        """Supported content types for chat."""
-        ...
-    
-    @property
-    def supports_functions(self) -> bool:
-        """Whether provider supports function calling."""
-        ...
-    
-    @property
-    def supports_json_response(self) -> bool:
-        """Whether provider supports native JSON responses."""
-        ...
+ChatResponseConverter = typing.Callable[
+    [typing.Any, base.ChatRequest, bytes | None],
+    base.ChatResponse
+]
+
+# Straight-line converters keyed by provider response model, registered
+# by models._converters for the built-in providers
+_CHAT_RESPONSE_CONVERTERS: dict[type, ChatResponseConverter] = {}
+
+def register_chat_response_converter(
+    response_model: type
+) -> typing.Callable[[ChatResponseConverter], ChatResponseConverter]:
+    """Register decorated function as converter for provider response model."""
+    def decorator(converter: ChatResponseConverter) -> ChatResponseConverter:
+        _CHAT_RESPONSE_CONVERTERS[response_model] = converter
+        return converter
+    return decorator
+
+def get_chat_response_converter(response_model: type) -> ChatResponseConverter:
+    """Get specialized converter for provider chat response model."""
+    try:
+        return _CHAT_RESPONSE_CONVERTERS[response_model]
+    except KeyError:
+        raise NotImplementedError(
+            f"No chat response converter for {response_model.__name__}"
+        ) from None
+
+def _has_methods(cls: type, methods: tuple[str, ...]) -> bool:
+    """Check that class or one of its bases defines every method."""
+    return all(
+        any(method in klass.__dict__ for klass in cls.__mro__)
+        for method in methods
+    )
+
+class CapabilityProvider(abc.ABC):
+    """Common base of the capability classes.
+
+    All capability attributes live in this one set of slots, so a single
+    provider class can implement several capabilities. Capability
+    ``__init__`` methods take keyword arguments and pass the rest along,
+    so a combined provider initializes every base with one call::
+
+        class OpenAIProvider(ChatProvider, EmbeddingProvider):
+            def __init__(self):
+                super().__init__(
+                    name="openai",
+                    supported_content_types={base.ContentType.TEXT},
+                    supports_functions=True,
+                    embedding_dimensions=1536
+                )
+    """
+
+    __slots__ = (
+        "name",
+        "supported_content_types",
+        "supports_functions",
+        "supports_json_response",
+        "embedding_dimensions",
+        "supported_voices",
+        "supported_audio_formats",
+    )
+
+    name: str  # Provider name
+    supported_content_types: set[base.ContentType]  # Supported content types
 
+    def __init__(
+        self,
+        name: str,
+        supported_content_types: set[base.ContentType] | None = None
+    ):
+        self.name = name
+        self.supported_content_types = supported_content_types or set()
+
+class ChatProvider(CapabilityProvider):
+    """Base class for chat completion capabilities.
+
+    Capability flags never change after construction, so they are plain
+    slot attributes rather than properties. Classes that implement the
+    methods without subclassing also pass ``isinstance`` checks.
+    """
+
+    __slots__ = ()
+
+    supports_functions: bool  # Whether provider supports function calling
+    supports_json_response: bool  # Whether provider supports native JSON responses
+
+    _methods = (
+        "validate_chat_request",
+        "convert_chat_request",
+        "convert_chat_response",
+        "convert_chat_stream",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        supported_content_types: set[base.ContentType],
+        supports_functions: bool = False,
+        supports_json_response: bool = False,
+        **kwargs: typing.Any
+    ):
+        self.supports_functions = supports_functions
+        self.supports_json_response = supports_json_response
+        super().__init__(
+            name=name,
+            supported_content_types=supported_content_types,
+            **kwargs
+        )
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        if cls is ChatProvider:
+            return _has_methods(subclass, cls._methods) or NotImplemented
+        return NotImplemented
+
+    @abc.abstractmethod
     async def validate_chat_request(
         self,
         request: base.ChatRequest
@@ -34,6 +128,7 @@ class ChatProvider(typing.Protocol):
         """Validate chat request."""
         ...
 
+    @abc.abstractmethod
     async def convert_chat_request(
         self,
         request: base.ChatRequest
@@ -41,40 +136,89 @@ class ChatProvider(typing.Protocol):
         """Convert universal chat request to provider format."""
         ...
 
+    async def validate_and_convert_chat_request(
+        self,
+        request: base.ChatRequest
+    ) -> tuple[list[str], bytes | None]:
+        """Validate chat request and serialize it in provider format.
+
+        Returns validation errors and the JSON request body, which is None
+        when there are errors. This default still makes three passes
+        (validate, convert, serialize); the request is walked only once
+        when a provider overrides it to check the request while building
+        its payload.
+        """
+        errors = await self.validate_chat_request(request)
+        if errors:
+            return errors, None
+        provider_request = await self.convert_chat_request(request)
+        return [], base.dump(provider_request)
+
     async def convert_chat_response(
         self,
         raw_response: typing.Any,
-        request: base.ChatRequest
+        request: base.ChatRequest,
+        raw_body: bytes | None = None
     ) -> base.ChatResponse:
-        """Convert provider chat response to universal format."""
-        ...
+        """Convert provider chat response to universal format.
+
+        ``raw_response`` is already validated, so implementations should
+        build the result with ``model_construct`` instead of revalidating.
+        ``raw_body`` is the response body it was parsed from, kept as
+        ``metadata.raw_response_bytes``.
+        Defaults to the specialized converter for the response model.
+        """
+        converter = get_chat_response_converter(type(raw_response))
+        return converter(raw_response, request, raw_body)
 
+    @abc.abstractmethod
     async def convert_chat_stream(
         self,
         raw_chunk: typing.Any,
         request: base.ChatRequest
-    ) -> base.ChatStreamResponse:
-        """Convert provider stream chunk to universal format."""
-        ...
+    ) -> base.ChatStreamResponse | None:
+        """Convert provider stream chunk to universal format.
 
-class EmbeddingProvider(typing.Protocol):
-    """Protocol for embedding capabilities."""
-    
-    @property
-    def name(self) -> str:
-        """Provider name."""
-        ...
-    
-    @property
-    def supported_content_types(self) -> set[base.ContentType]:
-        """Supported content types for embeddings."""
-        ...
-    
-    @property
-    def embedding_dimensions(self) -> int:
-        """Number of dimensions in the embedding vector."""
+        Called once per streamed chunk; build the result with
+        ``model_construct`` as ``raw_chunk`` is already validated.
+        Return None for chunks that carry nothing to forward.
+        """
         ...
 
+class EmbeddingProvider(CapabilityProvider):
+    """Base class for embedding capabilities."""
+
+    __slots__ = ()
+
+    embedding_dimensions: int  # Number of dimensions in the embedding vector
+
+    _methods = (
+        "validate_embedding_request",
+        "convert_embedding_request",
+        "convert_embedding_response",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        supported_content_types: set[base.ContentType],
+        embedding_dimensions: int,
+        **kwargs: typing.Any
+    ):
+        self.embedding_dimensions = embedding_dimensions
+        super().__init__(
+            name=name,
+            supported_content_types=supported_content_types,
+            **kwargs
+        )
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        if cls is EmbeddingProvider:
+            return _has_methods(subclass, cls._methods) or NotImplemented
+        return NotImplemented
+
+    @abc.abstractmethod
     async def validate_embedding_request(
         self,
         request: base.EmbeddingRequest
@@ -82,6 +226,7 @@ class EmbeddingProvider(typing.Protocol):
         """Validate embedding request."""
         ...
 
+    @abc.abstractmethod
     async def convert_embedding_request(
         self,
         request: base.EmbeddingRequest
@@ -89,32 +234,50 @@ class EmbeddingProvider(typing.Protocol):
         """Convert universal embedding request to provider format."""
         ...
 
+    @abc.abstractmethod
     async def convert_embedding_response(
         self,
         raw_response: typing.Any,
         request: base.EmbeddingRequest
     ) -> base.EmbeddingResponse:
-        """Convert provider embedding response to universal format."""
-        ...
+        """Convert provider embedding response to universal format.
 
-class SpeechProvider(typing.Protocol):
-    """Protocol for speech capabilities."""
-    
-    @property
-    def name(self) -> str:
-        """Provider name."""
-        ...
-    
-    @property
-    def supported_voices(self) -> list[str]:
-        """List of supported voices."""
-        ...
-    
-    @property
-    def supported_audio_formats(self) -> set[str]:
-        """Supported audio formats."""
+        ``raw_response`` is already validated; use ``model_construct``.
+        """
         ...
 
+class SpeechProvider(CapabilityProvider):
+    """Base class for speech capabilities."""
+
+    __slots__ = ()
+
+    supported_voices: list[str]  # List of supported voices
+    supported_audio_formats: set[str]  # Supported audio formats
+
+    _methods = (
+        "validate_speech_request",
+        "convert_speech_request",
+        "convert_speech_response",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        supported_voices: list[str],
+        supported_audio_formats: set[str],
+        **kwargs: typing.Any
+    ):
+        self.supported_voices = supported_voices
+        self.supported_audio_formats = supported_audio_formats
+        super().__init__(name=name, **kwargs)
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        if cls is SpeechProvider:
+            return _has_methods(subclass, cls._methods) or NotImplemented
+        return NotImplemented
+
+    @abc.abstractmethod
     async def validate_speech_request(
         self,
         request: base.SpeechRequest
@@ -122,6 +285,7 @@ class SpeechProvider(typing.Protocol):
         """Validate speech request."""
         ...
 
+    @abc.abstractmethod
     async def convert_speech_request(
         self,
         request: base.SpeechRequest
@@ -129,10 +293,14 @@ class SpeechProvider(typing.Protocol):
         """Convert universal speech request to provider format."""
         ...
 
+    @abc.abstractmethod
     async def convert_speech_response(
         self,
         raw_response: typing.Any,
         request: base.SpeechRequest
     ) -> base.SpeechResponse:
-        """Convert provider speech response to universal format."""
-        ...
\ No newline at end of file
+        """Convert provider speech response to universal format.
+
+        ``raw_response`` is already validated; use ``model_construct``.
+        """
+        ...
@@ -83,26 +83,27 @@ Response Features:
 """
 
 import typing
-import pydantic
 
-class InlineData(pydantic.BaseModel):
+from models._common import BaseModel
+
+class InlineData(BaseModel):
     mime_type: str
     data: str
 
-class FileData(pydantic.BaseModel):
+class FileData(BaseModel):
     file_uri: str
     mime_type: str | None = None
 
-class Part(pydantic.BaseModel):
+class Part(BaseModel):
     text: str | None = None
     inline_data: InlineData | None = None
     file_data: FileData | None = None
 
-class Content(pydantic.BaseModel):
+class Content(BaseModel):
     parts: list[Part]
     role: typing.Literal["user", "model"] | None = None
 
-class SafetySetting(pydantic.BaseModel):
+class SafetySetting(BaseModel):
     category: typing.Literal[
         "HARM_CATEGORY_UNSPECIFIED",
         "HARM_CATEGORY_HATE_SPEECH",
@@ -118,10 +119,10 @@ class SafetySetting(pydantic.BaseModel):
         "BLOCK_NONE"
     ]
 
-class Tool(pydantic.BaseModel):
+class Tool(BaseModel):
     function_declarations: list[dict[str, typing.Any]]
 
-class GenerationConfig(pydantic.BaseModel):
+class GenerationConfig(BaseModel):
     temperature: float | None = None
     top_p: float | None = None
     top_k: int | None = None
@@ -129,13 +130,13 @@ class GenerationConfig(pydantic.BaseModel):
     max_output_tokens: int | None = None
     stop_sequences: list[str] | None = None
 
-class GenerateContentRequest(pydantic.BaseModel):
+class GenerateContentRequest(BaseModel):
     contents: list[Content]
     tools: list[Tool] | None = None
     safety_settings: list[SafetySetting] | None = None
     generation_config: GenerationConfig | None = None
 
-class PromptFeedback(pydantic.BaseModel):
+class PromptFeedback(BaseModel):
     block_reason: typing.Literal[
         "BLOCK_REASON_UNSPECIFIED",
         "SAFETY",
@@ -143,16 +144,16 @@ class PromptFeedback(pydantic.BaseModel):
     ] | None = None
     safety_ratings: list[dict[str, str]] | None = None
 
-class CitationSource(pydantic.BaseModel):
+class CitationSource(BaseModel):
     start_index: int
     end_index: int
     uri: str
     license: str
 
-class CitationMetadata(pydantic.BaseModel):
+class CitationMetadata(BaseModel):
     citation_sources: list[CitationSource]
 
-class Candidate(pydantic.BaseModel):
+class Candidate(BaseModel):
     content: Content
     finish_reason: typing.Literal[
         "FINISH_REASON_UNSPECIFIED",
@@ -166,22 +167,28 @@ class Candidate(pydantic.BaseModel):
     citation_metadata: CitationMetadata | None = None
     token_count: int | None = None
 
-class GenerateContentResponse(pydantic.BaseModel):
+class GenerateContentResponse(BaseModel):
     candidates: list[Candidate] | None = None
     prompt_feedback: PromptFeedback | None = None
 
 # Streaming models
-class StreamGenerateContentResponse(pydantic.BaseModel):
+class StreamGenerateContentResponse(BaseModel):
     candidates: list[Candidate] | None = None
     prompt_feedback: PromptFeedback | None = None
     usage_metadata: dict[str, typing.Any] | None = None
 
 # Function calling models
-class FunctionResponse(pydantic.BaseModel):
+class FunctionResponse(BaseModel):
     name: str
     args: dict[str, typing.Any]
 
-class FunctionCall(pydantic.BaseModel):
+class FunctionCall(BaseModel):
     name: str
     args: dict[str, typing.Any]
-    response: FunctionResponse | None = None
\ No newline at end of file
+    response: FunctionResponse | None = None
+# Embedding models
+class ContentEmbedding(BaseModel):
+    values: list[float]
+
+class EmbeddingResponse(BaseModel):
+    embedding: ContentEmbedding
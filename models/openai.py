@@ -65,40 +65,29 @@ Example Usage:
 """
 
 import typing
-import pydantic
 
-class FunctionParameter(pydantic.BaseModel):
-    type: str
-    description: str | None = None
-    enum: list[str] | None = None
-    items: dict[str, typing.Any] | None = None
-    properties: dict[str, 'FunctionParameter'] | None = None
-    required: list[str] | None = None
+from models._common import BaseModel
+from models._function_schema import FunctionParameter, FunctionSchema as Function
 
-class Function(pydantic.BaseModel):
-    name: str
-    description: str
-    parameters: FunctionParameter
-
-class FunctionCall(pydantic.BaseModel):
+class FunctionCall(BaseModel):
     name: str
     arguments: str
 
-class Tool(pydantic.BaseModel):
+class Tool(BaseModel):
     type: str = "function"
     function: Function
 
-class ResponseFormat(pydantic.BaseModel):
+class ResponseFormat(BaseModel):
     type: typing.Literal["text", "json_object"] = "text"
 
-class Message(pydantic.BaseModel):
+class Message(BaseModel):
     role: typing.Literal["system", "user", "assistant", "function", "tool"]
     content: str | list[dict[str, typing.Any]] | None = None
     name: str | None = None
     function_call: FunctionCall | None = None
     tool_calls: list[dict[str, typing.Any]] | None = None
 
-class ChatCompletionRequest(pydantic.BaseModel):
+class ChatCompletionRequest(BaseModel):
     model: str
     messages: list[Message]
     functions: list[Function] | None = None
@@ -117,17 +106,17 @@ class ChatCompletionRequest(pydantic.BaseModel):
     user: str | None = None
     response_format: ResponseFormat | None = None
 
-class Choice(pydantic.BaseModel):
+class Choice(BaseModel):
     index: int
     message: Message
     finish_reason: str | None = None
 
-class Usage(pydantic.BaseModel):
+class Usage(BaseModel):
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
 
-class ChatCompletionResponse(pydantic.BaseModel):
+class ChatCompletionResponse(BaseModel):
     id: str
     object: str
     created: int
@@ -136,18 +125,18 @@ class ChatCompletionResponse(pydantic.BaseModel):
     usage: Usage
 
 # Streaming response models
-class DeltaMessage(pydantic.BaseModel):
+class DeltaMessage(BaseModel):
     role: str | None = None
     content: str | None = None
     function_call: FunctionCall | None = None
     tool_calls: list[dict[str, typing.Any]] | None = None
 
-class StreamChoice(pydantic.BaseModel):
+class StreamChoice(BaseModel):
     index: int
     delta: DeltaMessage
     finish_reason: str | None = None
 
-class ChatCompletionStreamResponse(pydantic.BaseModel):
+class ChatCompletionStreamResponse(BaseModel):
     id: str
     object: str
     created: int
@@ -155,13 +144,28 @@ class ChatCompletionStreamResponse(pydantic.BaseModel):
     choices: list[StreamChoice]
 
 # Content types for multimodal messages
-class ContentPart(pydantic.BaseModel):
+class ContentPart(BaseModel):
     type: typing.Literal["text", "image_url", "image_file", "video_file", "audio_file", "pdf_file"]
     text: str | None = None
     image_url: dict[str, str] | None = None
     file_url: dict[str, str] | None = None
 
-class MultiModalMessage(pydantic.BaseModel):
+class MultiModalMessage(BaseModel):
     role: typing.Literal["system", "user", "assistant", "function", "tool"]
     content: list[ContentPart]
-    name: str | None = None
\ No newline at end of file
+    name: str | None = None
+# Embedding models
+class EmbeddingData(BaseModel):
+    object: typing.Literal["embedding"] = "embedding"
+    index: int
+    embedding: list[float] | str  # str for base64 encoding_format
+
+class EmbeddingUsage(BaseModel):
+    prompt_tokens: int
+    total_tokens: int
+
+class EmbeddingResponse(BaseModel):
+    object: typing.Literal["list"] = "list"
+    data: list[EmbeddingData]
+    model: str
+    usage: EmbeddingUsage
@@ -3,7 +3,7 @@
 import lib.app.settings as settings
 import models.anthropic as anthropic_models
 from repositories.base import ChatRepository
-from exceptions import UnsupportedOperationError
+from exceptions import ConfigurationError, UnsupportedOperationError
 
 class AnthropicBaseMixin:
     """Mixin with common Anthropic functionality."""
@@ -31,4 +31,5 @@ class AnthropicBaseMixin:
 class AnthropicChatRepository(AnthropicBaseMixin, ChatRepository):
     """Anthropic chat completion repository."""
     
-    chat_response_model = anthropic_models.MessageResponse
\ No newline at end of file
+    chat_response_model = anthropic_models.MessageResponse
+    chat_stream_model = anthropic_models.MessageStreamResponse
\ No newline at end of file
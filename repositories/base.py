@@ -1,13 +1,18 @@
 """Base repository implementations."""
 
 import logging
+import types
 import typing
 
+import httpx
+
 import lib.app.settings as settings
 import models.base as base
 import models.capabilities as capabilities
+import utils.cache as cache_utils
 import utils.fetch as fetch
 import utils.logging as logging_utils
+from repositories.semantic_cache import SemanticCache
 from exceptions import (
     UnsupportedOperationError,
     ValidationError,
@@ -21,10 +26,28 @@ class BaseLLMRepository:
     
     base_url: str
     provider_name: str
+    pool_size: int = fetch.DEFAULT_POOL_SIZE
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        pool_size: int | None = None
+    ):
         """Initialize repository."""
         self.api_key = api_key or self._get_api_key()
+        self._validate_configuration()
+        # Headers never change after construction
+        self._headers = types.MappingProxyType(self._get_headers())
+        self.pool_size = pool_size or self.pool_size
+        
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for provider host.
+
+        Looked up per call rather than kept, so requests made after
+        ``fetch.close_clients()`` get a new client instead of a closed one.
+        """
+        return fetch.get_client(self.base_url, self.pool_size)
         
     def _get_api_key(self) -> str:
         """Get API key from settings."""
@@ -38,6 +61,23 @@ class BaseLLMRepository:
             f"Headers not implemented for {self.provider_name}"
         )
         
+    def _invalid_request_error(self, errors: list[str]) -> Exception:
+        """Get exception raised for a request that fails provider validation."""
+        return ValueError(errors)
+        
+    async def prewarm(self) -> None:
+        """Open a pooled connection to the provider ahead of real traffic.
+
+        Any response status is fine, the point is the TCP/TLS handshake.
+        """
+        try:
+            await self.client.head(self.base_url)
+        except httpx.HTTPError as e:
+            logger.debug(
+                "Connection prewarm failed",
+                extra={"provider": self.provider_name, "error": str(e)}
+            )
+
     def _validate_configuration(self) -> None:
         """Validate repository configuration."""
         if not self.api_key:
@@ -50,30 +90,141 @@ class ChatRepository(BaseLLMRepository):
     """Repository for chat completion capabilities."""
     
     chat_response_model: type[typing.Any]
+    chat_stream_model: type[typing.Any]
     
-    def __init__(self, provider: capabilities.ChatProvider):
+    def __init__(
+        self,
+        provider: capabilities.ChatProvider,
+        api_key: str | None = None,
+        pool_size: int | None = None,
+        cache: cache_utils.LRUCache | None = None,
+        semantic_cache: SemanticCache | None = None
+    ):
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.ChatProvider):
+            raise UnsupportedOperationError(
+                f"Chat completion not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._chat_url = f"{self.base_url}/v1/chat/completions"
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        
+    def _get_chat_url(self, request: base.ChatRequest) -> str:
+        """Get chat completion endpoint for request."""
+        return self._chat_url
+        
+    def _get_chat_stream_url(self, request: base.ChatRequest) -> str:
+        """Get streaming chat completion endpoint for request."""
+        return self._chat_url
         
     async def complete(
         self,
         request: base.ChatRequest
     ) -> base.ChatResponse:
-        """Send chat completion request."""
-        errors = await self.provider.validate_chat_request(request)
+        """Send chat completion request.
+
+        Requests are validated before any cache lookup, so an invalid
+        request never gets a cached answer. Cached responses are returned
+        as copies, so callers may modify them.
+        """
+        errors, provider_request = (
+            await self.provider.validate_and_convert_chat_request(request)
+        )
         if errors:
-            raise ValueError(errors)
-            
-        provider_request = await self.provider.convert_chat_request(request)
-        
+            raise self._invalid_request_error(errors)
+
+        if self.cache is not None:
+            cache_key = cache_utils.chat_request_key(self.provider_name, request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        prompt_vector = None
+        if self.semantic_cache is not None:
+            try:
+                prompt_vector = await self.semantic_cache.embed_prompt(request)
+            except Exception as e:
+                # The cache is an optimization, a failed lookup must not
+                # fail the completion
+                logger.warning(
+                    "Semantic cache prompt embedding failed",
+                    extra={"provider": self.provider_name, "error": str(e)}
+                )
+            if prompt_vector is not None:
+                context_key = cache_utils.chat_context_key(
+                    self.provider_name,
+                    request
+                )
+                cached = await self.semantic_cache.find(context_key, prompt_vector)
+                if cached is not None:
+                    return cached.model_copy(deep=True)
+
         try:
-            raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/chat/completions",
+            raw_response, raw_body = await fetch.make_request(
+                url=self._get_chat_url(request),
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
-                model=self.chat_response_model
+                client=self.client,
+                model=self.chat_response_model,
+                return_body=True
+            )
+            response = await self.provider.convert_chat_response(
+                raw_response,
+                request,
+                raw_body
             )
-            return await self.provider.convert_chat_response(raw_response, request)
+        except Exception as e:
+            raise await self.provider.convert_error(e)
+
+        if self.cache is not None or prompt_vector is not None:
+            # Cache a private copy so the caller can modify the response
+            cached = response.model_copy(deep=True)
+        if self.cache is not None:
+            usage = response.metadata.usage
+            self.cache.set(
+                cache_key,
+                cached,
+                cost=(usage.total_tokens or 0) if usage else 0
+            )
+        if prompt_vector is not None:
+            self.semantic_cache.add(context_key, prompt_vector, cached)
+        return response
+
+    async def stream(
+        self,
+        request: base.ChatRequest
+    ) -> typing.AsyncIterator[base.ChatStreamResponse]:
+        """Stream chat completion chunks.
+
+        Streamed responses are not cached; feed the chunks to a
+        ChatStreamAccumulator to build the complete response.
+        """
+        if not request.config.stream:
+            request = request.model_copy(update={
+                "config": request.config.model_copy(update={"stream": True})
+            })
+
+        errors, provider_request = (
+            await self.provider.validate_and_convert_chat_request(request)
+        )
+        if errors:
+            raise self._invalid_request_error(errors)
+
+        try:
+            async for raw_chunk in fetch.stream_request(
+                url=self._get_chat_stream_url(request),
+                method="POST",
+                headers=self._headers,
+                body=provider_request,
+                client=self.client,
+                model=self.chat_stream_model
+            ):
+                chunk = await self.provider.convert_chat_stream(raw_chunk, request)
+                if chunk is not None:
+                    yield chunk
         except Exception as e:
             raise await self.provider.convert_error(e)
 
@@ -82,39 +233,87 @@ class EmbeddingRepository(BaseLLMRepository):
     
     embedding_response_model: type[typing.Any]
     
-    def __init__(self, provider: capabilities.EmbeddingProvider):
+    def __init__(
+        self,
+        provider: capabilities.EmbeddingProvider,
+        api_key: str | None = None,
+        pool_size: int | None = None,
+        cache: cache_utils.LRUCache | None = None
+    ):
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.EmbeddingProvider):
+            raise UnsupportedOperationError(
+                f"Embeddings not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._embeddings_url = f"{self.base_url}/v1/embeddings"
+        self.cache = cache
+        
+    def _get_embeddings_url(self, request: base.EmbeddingRequest) -> str:
+        """Get embeddings endpoint for request."""
+        return self._embeddings_url
         
     async def embed(
         self,
         request: base.EmbeddingRequest
     ) -> base.EmbeddingResponse:
-        """Generate embeddings for input."""
+        """Generate embeddings for input.
+
+        Cached responses are returned as copies, so callers may modify them.
+        """
+        if self.cache is not None:
+            cache_key = cache_utils.embedding_request_key(self.provider_name, request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
         errors = await self.provider.validate_embedding_request(request)
         if errors:
-            raise ValueError(errors)
+            raise self._invalid_request_error(errors)
             
         provider_request = await self.provider.convert_embedding_request(request)
         
         try:
             raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/embeddings",
+                url=self._get_embeddings_url(request),
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
+                client=self.client,
                 model=self.embedding_response_model
             )
-            return await self.provider.convert_embedding_response(raw_response, request)
+            response = await self.provider.convert_embedding_response(raw_response, request)
         except Exception as e:
             raise await self.provider.convert_error(e)
 
+        if self.cache is not None:
+            self.cache.set(
+                cache_key,
+                response.model_copy(deep=True),
+                cost=response.usage.total_tokens or 0
+            )
+        return response
+
 class SpeechRepository(BaseLLMRepository):
     """Repository for speech synthesis capabilities."""
     
     speech_response_model: type[typing.Any]
     
-    def __init__(self, provider: capabilities.SpeechProvider):
+    def __init__(
+        self,
+        provider: capabilities.SpeechProvider,
+        api_key: str | None = None,
+        pool_size: int | None = None
+    ):
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.SpeechProvider):
+            raise UnsupportedOperationError(
+                f"Speech synthesis not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._speech_url = f"{self.base_url}/v1/audio/speech"
         
     async def synthesize(
         self,
@@ -123,16 +322,17 @@ class SpeechRepository(BaseLLMRepository):
         """Generate speech from text."""
         errors = await self.provider.validate_speech_request(request)
         if errors:
-            raise ValueError(errors)
+            raise self._invalid_request_error(errors)
             
         provider_request = await self.provider.convert_speech_request(request)
         
         try:
             raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/audio/speech",
+                url=self._speech_url,
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
+                client=self.client,
                 model=self.speech_response_model
             )
             return await self.provider.convert_speech_response(raw_response, request)
@@ -1,8 +1,11 @@
 """Base repository implementations."""
 
 import logging
+import types
 import typing
 
+import httpx
+
 import lib.app.settings as settings
 import models.base as base
 import models.capabilities as capabilities
@@ -21,10 +24,28 @@ class BaseLLMRepository:
     
     base_url: str
     provider_name: str
+    pool_size: int = fetch.DEFAULT_POOL_SIZE
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        pool_size: int | None = None
+    ):
         """Initialize repository."""
         self.api_key = api_key or self._get_api_key()
+        self._validate_configuration()
+        # Headers never change after construction
+        self._headers = types.MappingProxyType(self._get_headers())
+        self.pool_size = pool_size or self.pool_size
+        
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for provider host.
+
+        Looked up per call rather than kept, so requests made after
+        ``fetch.close_clients()`` get a new client instead of a closed one.
+        """
+        return fetch.get_client(self.base_url, self.pool_size)
         
     def _get_api_key(self) -> str:
         """Get API key from settings."""
@@ -38,6 +59,19 @@ class BaseLLMRepository:
             f"Headers not implemented for {self.provider_name}"
         )
         
+    async def prewarm(self) -> None:
+        """Open a pooled connection to the provider ahead of real traffic.
+
+        Any response status is fine, the point is the TCP/TLS handshake.
+        """
+        try:
+            await self.client.head(self.base_url)
+        except httpx.HTTPError as e:
+            logger.debug(
+                "Connection prewarm failed",
+                extra={"provider": self.provider_name, "error": str(e)}
+            )
+
     def _validate_configuration(self) -> None:
         """Validate repository configuration."""
         if not self.api_key:
@@ -54,10 +88,17 @@ class ChatRepository(BaseLLMRepository):
     def __init__(
         self,
         provider: capabilities.ChatProvider,
-        api_key: str | None = None
+        api_key: str | None = None,
+        pool_size: int | None = None
     ):
-        super().__init__(api_key)
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.ChatProvider):
+            raise UnsupportedOperationError(
+                f"Chat completion not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._chat_url = f"{self.base_url}/v1/chat/completions"
         
     @logging_utils.log_operation(
         provider="provider_name",
@@ -68,32 +109,30 @@ class ChatRepository(BaseLLMRepository):
         request: base.ChatRequest
     ) -> base.ChatResponse:
         """Send chat completion request."""
-        self._validate_configuration()
-        
-        if not isinstance(self.provider, capabilities.ChatProvider):
-            raise UnsupportedOperationError(
-                f"Chat completion not supported by {self.provider_name}",
-                provider=self.provider_name
-            )
-        
-        errors = await self.provider.validate_chat_request(request)
+        errors, provider_request = (
+            await self.provider.validate_and_convert_chat_request(request)
+        )
         if errors:
             raise ValidationError(
                 f"Invalid request: {', '.join(errors)}",
                 provider=self.provider_name
             )
-            
-        provider_request = await self.provider.convert_chat_request(request)
         
         try:
-            raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/chat/completions",
+            raw_response, raw_body = await fetch.make_request(
+                url=self._chat_url,
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
-                model=self.chat_response_model
+                client=self.client,
+                model=self.chat_response_model,
+                return_body=True
+            )
+            return await self.provider.convert_chat_response(
+                raw_response,
+                request,
+                raw_body
             )
-            return await self.provider.convert_chat_response(raw_response, request)
         except Exception as e:
             raise await self.provider.convert_error(e)
 
@@ -105,10 +144,17 @@ class EmbeddingRepository(BaseLLMRepository):
     def __init__(
         self,
         provider: capabilities.EmbeddingProvider,
-        api_key: str | None = None
+        api_key: str | None = None,
+        pool_size: int | None = None
     ):
-        super().__init__(api_key)
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.EmbeddingProvider):
+            raise UnsupportedOperationError(
+                f"Embeddings not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._embeddings_url = f"{self.base_url}/v1/embeddings"
         
     @logging_utils.log_operation(
         provider="provider_name",
@@ -119,14 +165,6 @@ class EmbeddingRepository(BaseLLMRepository):
         request: base.EmbeddingRequest
     ) -> base.EmbeddingResponse:
         """Generate embeddings for input."""
-        self._validate_configuration()
-        
-        if not isinstance(self.provider, capabilities.EmbeddingProvider):
-            raise UnsupportedOperationError(
-                f"Embeddings not supported by {self.provider_name}",
-                provider=self.provider_name
-            )
-        
         errors = await self.provider.validate_embedding_request(request)
         if errors:
             raise ValidationError(
@@ -138,10 +176,11 @@ class EmbeddingRepository(BaseLLMRepository):
         
         try:
             raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/embeddings",
+                url=self._embeddings_url,
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
+                client=self.client,
                 model=self.embedding_response_model
             )
             return await self.provider.convert_embedding_response(raw_response, request)
@@ -156,10 +195,17 @@ class SpeechRepository(BaseLLMRepository):
     def __init__(
         self,
         provider: capabilities.SpeechProvider,
-        api_key: str | None = None
+        api_key: str | None = None,
+        pool_size: int | None = None
     ):
-        super().__init__(api_key)
+        super().__init__(api_key, pool_size)
+        if not isinstance(provider, capabilities.SpeechProvider):
+            raise UnsupportedOperationError(
+                f"Speech synthesis not supported by {self.provider_name}",
+                provider=self.provider_name
+            )
         self.provider = provider
+        self._speech_url = f"{self.base_url}/v1/audio/speech"
         
     @logging_utils.log_operation(
         provider="provider_name",
@@ -170,14 +216,6 @@ class SpeechRepository(BaseLLMRepository):
         request: base.SpeechRequest
     ) -> base.SpeechResponse:
         """Generate speech from text."""
-        self._validate_configuration()
-        
-        if not isinstance(self.provider, capabilities.SpeechProvider):
-            raise UnsupportedOperationError(
-                f"Speech synthesis not supported by {self.provider_name}",
-                provider=self.provider_name
-            )
-        
         errors = await self.provider.validate_speech_request(request)
         if errors:
             raise ValidationError(
@@ -189,10 +227,11 @@ class SpeechRepository(BaseLLMRepository):
         
         try:
             raw_response = await fetch.make_request(
-                url=f"{self.base_url}/v1/audio/speech",
+                url=self._speech_url,
                 method="POST",
-                headers=self._get_headers(),
+                headers=self._headers,
                 body=provider_request,
+                client=self.client,
                 model=self.speech_response_model
             )
             return await self.provider.convert_speech_response(raw_response, request)
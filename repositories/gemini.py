@@ -1,19 +1,24 @@
 """Google Gemini repository implementations."""
 
 import lib.app.settings as settings
+import models.base as base
 import models.gemini as gemini_models
+import utils.logging as logging_utils
 from repositories.base import ChatRepository, EmbeddingRepository
-from exceptions import UnsupportedOperationError
+from exceptions import ConfigurationError, ValidationError
 
 class GeminiBaseMixin:
     """Mixin with common Gemini functionality."""
     
     provider_name = "gemini"
     base_url = "https://generativelanguage.googleapis.com"
+    pool_size = 200
     
-    def __init__(self, api_key: str | None = None, version: str = "v1"):
-        super().__init__(api_key)
+    def __init__(self, *args, version: str | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
         self.version = version or settings.llms.gemini_version or "v1"
+        # Only the model name and method vary per request
+        self._url_prefix = f"{self.base_url}/{self.version}/models/"
     
     def _get_api_key(self) -> str:
         """Get Gemini API key from settings."""
@@ -27,13 +32,22 @@ class GeminiBaseMixin:
     def _get_headers(self) -> dict[str, str]:
         """Get Gemini API headers."""
         return {
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "x-goog-api-key": self.api_key
         }
+    
+    def _invalid_request_error(self, errors: list[str]) -> Exception:
+        """Get validation error for invalid Gemini request."""
+        return ValidationError(
+            f"Invalid request: {', '.join(errors)}",
+            provider=self.provider_name
+        )
 
 class GeminiChatRepository(GeminiBaseMixin, ChatRepository):
     """Gemini chat completion repository."""
     
     chat_response_model = gemini_models.GenerateContentResponse
+    chat_stream_model = gemini_models.StreamGenerateContentResponse
     
     @logging_utils.log_operation(
         provider="gemini",
@@ -43,36 +57,16 @@ class GeminiChatRepository(GeminiBaseMixin, ChatRepository):
         self,
         request: base.ChatRequest
     ) -> base.ChatResponse:
-        """Override to handle API key in URL."""
-        self._validate_configuration()
-        
-        if not isinstance(self.provider, capabilities.ChatProvider):
-            raise UnsupportedOperationError(
-                "Chat completion not supported by Gemini",
-                provider=self.provider_name
-            )
-        
-        errors = await self.provider.validate_chat_request(request)
-        if errors:
-            raise ValidationError(
-                f"Invalid request: {', '.join(errors)}",
-                provider=self.provider_name
-            )
-            
-        provider_request = await self.provider.convert_chat_request(request)
-        
-        try:
-            raw_response = await fetch.make_request(
-                url=f"{self.base_url}/{self.version}/models/{request.model}:generateContent",
-                method="POST",
-                headers=self._get_headers(),
-                params={"key": self.api_key},
-                body=provider_request,
-                model=self.chat_response_model
-            )
-            return await self.provider.convert_chat_response(raw_response, request)
-        except Exception as e:
-            raise await self.provider.convert_error(e)
+        """Send chat completion request, with operation logging."""
+        return await super().complete(request)
+    
+    def _get_chat_url(self, request: base.ChatRequest) -> str:
+        """Get per-model Gemini generate endpoint."""
+        return self._url_prefix + request.model + ":generateContent"
+    
+    def _get_chat_stream_url(self, request: base.ChatRequest) -> str:
+        """Get per-model Gemini streaming endpoint, framed as SSE."""
+        return self._url_prefix + request.model + ":streamGenerateContent?alt=sse"
 
 class GeminiEmbeddingRepository(GeminiBaseMixin, EmbeddingRepository):
     """Gemini embeddings repository."""
@@ -87,33 +81,9 @@ class GeminiEmbeddingRepository(GeminiBaseMixin, EmbeddingRepository):
         self,
         request: base.EmbeddingRequest
     ) -> base.EmbeddingResponse:
-        """Override to handle API key in URL."""
-        self._validate_configuration()
-        
-        if not isinstance(self.provider, capabilities.EmbeddingProvider):
-            raise UnsupportedOperationError(
-                "Embeddings not supported by Gemini",
-                provider=self.provider_name
-            )
-        
-        errors = await self.provider.validate_embedding_request(request)
-        if errors:
-            raise ValidationError(
-                f"Invalid request: {', '.join(errors)}",
-                provider=self.provider_name
-            )
-            
-        provider_request = await self.provider.convert_embedding_request(request)
-        
-        try:
-            raw_response = await fetch.make_request(
-                url=f"{self.base_url}/{self.version}/models/{request.model}:embedContent",
-                method="POST",
-                headers=self._get_headers(),
-                params={"key": self.api_key},
-                body=provider_request,
-                model=self.embedding_response_model
-            )
-            return await self.provider.convert_embedding_response(raw_response, request)
-        except Exception as e:
-            raise await self.provider.convert_error(e)
\ No newline at end of file
+        """Generate embeddings for input, with operation logging."""
+        return await super().embed(request)
+    
+    def _get_embeddings_url(self, request: base.EmbeddingRequest) -> str:
+        """Get per-model Gemini embed endpoint."""
+        return self._url_prefix + request.model + ":embedContent"
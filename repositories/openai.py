@@ -3,12 +3,14 @@
 import lib.app.settings as settings
 import models.openai as openai_models
 from repositories.base import ChatRepository, EmbeddingRepository
+from exceptions import ConfigurationError
 
 class OpenAIBaseMixin:
     """Mixin with common OpenAI functionality."""
     
     provider_name = "openai"
     base_url = "https://api.openai.com"
+    pool_size = 200
     
     def _get_api_key(self) -> str:
         """Get OpenAI API key from settings."""
@@ -31,6 +33,7 @@ class OpenAIChatRepository(OpenAIBaseMixin, ChatRepository):
     """OpenAI chat completion repository."""
     
     chat_response_model = openai_models.ChatCompletionResponse
+    chat_stream_model = openai_models.ChatCompletionStreamResponse
 
 class OpenAIEmbeddingRepository(OpenAIBaseMixin, EmbeddingRepository):
     """OpenAI embeddings repository."""
@@ -0,0 +1,137 @@
+"""Semantic chat response cache backed by an embedding repository."""
+
+import asyncio
+import collections
+import math
+import operator
+import typing
+
+import models.base as base
+
+if typing.TYPE_CHECKING:
+    from repositories.base import EmbeddingRepository
+
+# Buckets up to this size are scanned inline, larger ones in a worker
+# thread. The scan is pure Python and holds the GIL either way; in a
+# thread the event loop still gets the GIL between switch intervals
+# instead of waiting for the whole scan, but other requests are slowed
+# for as long as it runs
+INLINE_SCAN_SIZE = 32
+
+Entry = tuple[list[float], base.ChatResponse]
+
+def _best_match(
+    entries: typing.Iterable[Entry],
+    vector: list[float],
+    threshold: float
+) -> base.ChatResponse | None:
+    """Get response whose prompt vector is most similar above threshold."""
+    best_score = threshold
+    best_response = None
+    for cached_vector, response in entries:
+        score = sum(map(operator.mul, vector, cached_vector))
+        if score >= best_score:
+            best_score = score
+            best_response = response
+    return best_response
+
+class SemanticCache:
+    """Chat response cache looked up by prompt similarity.
+
+    The text of the last user message is embedded and compared by cosine
+    similarity with prompts answered before in the same context, so
+    paraphrased prompts can be served without a provider round-trip. The
+    context is a key over everything else in the request (provider,
+    model, system prompt, earlier turns, config and media attached to the
+    prompt), see ``utils.cache.chat_context_key``.
+    """
+
+    def __init__(
+        self,
+        embedding_repo: 'EmbeddingRepository',
+        embedding_model: str,
+        threshold: float = 0.92,
+        maxsize: int = 256,
+        max_prompt_chars: int = 5000
+    ):
+        self.embedding_repo = embedding_repo
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.max_prompt_chars = max_prompt_chars
+        # Unit-length prompt vectors with their responses, per context key,
+        # least recently added context first
+        self._entries: collections.OrderedDict[
+            str, collections.deque[Entry]
+        ] = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _prompt(self, request: base.ChatRequest) -> str | None:
+        """Get text of last user message, None if not cacheable."""
+        for message in reversed(request.messages):
+            if message.role == "user":
+                text = " ".join(
+                    content.text for content in message.content if content.text
+                )
+                if text and len(text) <= self.max_prompt_chars:
+                    return text
+                return None
+        return None
+
+    async def embed_prompt(self, request: base.ChatRequest) -> list[float] | None:
+        """Get unit-length embedding of request prompt.
+
+        Returns None for requests that skip the semantic cache: no user
+        message, or a prompt too long to be worth matching.
+        """
+        prompt = self._prompt(request)
+        if prompt is None:
+            return None
+
+        response = await self.embedding_repo.embed(
+            base.EmbeddingRequest(model=self.embedding_model, input=[prompt])
+        )
+        vector = response.data[0].embedding
+        norm = math.hypot(*vector)
+        return [value / norm for value in vector] if norm else None
+
+    async def find(self, key: str, vector: list[float]) -> base.ChatResponse | None:
+        """Get cached response for the most similar prompt above threshold.
+
+        Cost grows with bucket size times vector dimensions and is paid in
+        Python bytecode, so keep ``maxsize`` small.
+        """
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        if len(entries) <= INLINE_SCAN_SIZE:
+            return _best_match(entries, vector, self.threshold)
+        # Snapshot, as add() may run while the worker thread scans
+        return await asyncio.to_thread(
+            _best_match, tuple(entries), vector, self.threshold
+        )
+
+    def add(
+        self,
+        key: str,
+        vector: list[float],
+        response: base.ChatResponse
+    ) -> None:
+        """Cache response for prompt vector, dropping the oldest over maxsize."""
+        entries = self._entries.get(key)
+        if entries is None:
+            entries = self._entries[key] = collections.deque()
+        else:
+            self._entries.move_to_end(key)
+        entries.append((vector, response))
+        self._size += 1
+
+        while self._size > self.maxsize:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            oldest.popleft()
+            self._size -= 1
+            if not oldest:
+                del self._entries[oldest_key]
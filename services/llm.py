@@ -1,10 +1,63 @@
 """LLM service implementation."""
 
+import asyncio
+import typing
+
 import models.base as base
+import utils.fetch as fetch
 from repositories.base import ChatRepository, EmbeddingRepository, SpeechRepository
+from exceptions import ProviderError
+
+async def _chat_unsupported(request: base.ChatRequest) -> base.ChatResponse:
+    """Fail chat completion for a service without chat repository."""
+    raise NotImplementedError("Chat completion not supported")
+
+async def _embeddings_unsupported(
+    request: base.EmbeddingRequest
+) -> base.EmbeddingResponse:
+    """Fail embeddings for a service without embedding repository."""
+    raise NotImplementedError("Embeddings not supported")
+
+async def _speech_unsupported(request: base.SpeechRequest) -> base.SpeechResponse:
+    """Fail speech synthesis for a service without speech repository."""
+    raise NotImplementedError("Speech synthesis not supported")
+
+class _UnsupportedStream:
+    """Chat stream for a service without chat repository.
+
+    Called like ``ChatRepository.stream``; fails on first iteration.
+    """
+
+    def __init__(self, request: base.ChatRequest):
+        self.request = request
+
+    def __aiter__(self) -> '_UnsupportedStream':
+        return self
+
+    async def __anext__(self) -> base.ChatStreamResponse:
+        raise NotImplementedError("Chat streaming not supported")
 
 class LLMService:
-    """Service for LLM interactions."""
+    """Service for LLM interactions.
+    
+    ``complete``, ``stream``, ``embed`` and ``synthesize`` are bound
+    straight to the repository methods, so calls do not go through a
+    forwarding frame.
+    Without a repository they raise NotImplementedError.
+    """
+    
+    complete: typing.Callable[
+        [base.ChatRequest], typing.Awaitable[base.ChatResponse]
+    ]  # Send chat completion request
+    stream: typing.Callable[
+        [base.ChatRequest], typing.AsyncIterator[base.ChatStreamResponse]
+    ]  # Stream chat completion chunks
+    embed: typing.Callable[
+        [base.EmbeddingRequest], typing.Awaitable[base.EmbeddingResponse]
+    ]  # Generate embeddings for input
+    synthesize: typing.Callable[
+        [base.SpeechRequest], typing.Awaitable[base.SpeechResponse]
+    ]  # Generate speech from text
     
     def __init__(
         self,
@@ -16,30 +69,110 @@ class LLMService:
         self.chat_repo = chat_repo
         self.embedding_repo = embedding_repo
         self.speech_repo = speech_repo
+        self.complete = chat_repo.complete if chat_repo else _chat_unsupported
+        self.stream = chat_repo.stream if chat_repo else _UnsupportedStream
+        self.embed = embedding_repo.embed if embedding_repo else _embeddings_unsupported
+        self.synthesize = (
+            speech_repo.synthesize if speech_repo else _speech_unsupported
+        )
     
-    async def complete(
-        self,
-        request: base.ChatRequest
-    ) -> base.ChatResponse:
-        """Send chat completion request."""
-        if not self.chat_repo:
-            raise NotImplementedError("Chat completion not supported")
-        return await self.chat_repo.complete(request)
-    
-    async def embed(
+    async def complete_batch(
         self,
-        request: base.EmbeddingRequest
-    ) -> base.EmbeddingResponse:
-        """Generate embeddings for input."""
-        if not self.embedding_repo:
-            raise NotImplementedError("Embeddings not supported")
-        return await self.embedding_repo.embed(request)
-    
-    async def synthesize(
+        requests: list[base.ChatRequest],
+        max_concurrency: int = 16
+    ) -> list[base.ChatResponse]:
+        """Send several chat completion requests concurrently."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _complete(request: base.ChatRequest) -> base.ChatResponse:
+            async with semaphore:
+                return await self.complete(request)
+
+        return list(await asyncio.gather(*map(_complete, requests)))
+    
+    async def embed_batch(
         self,
-        request: base.SpeechRequest
-    ) -> base.SpeechResponse:
-        """Generate speech from text."""
-        if not self.speech_repo:
-            raise NotImplementedError("Speech synthesis not supported")
-        return await self.speech_repo.synthesize(request)
\ No newline at end of file
+        requests: list[base.EmbeddingRequest],
+        max_batch_size: int = 2048,
+        max_concurrency: int = 16
+    ) -> list[base.EmbeddingResponse]:
+        """Generate embeddings for several requests.
+
+        Requests for the same model and encoding are merged into provider
+        calls of at most ``max_batch_size`` inputs and the results split
+        back per request, so ``usage`` on each result reflects the merged
+        call. A request larger than ``max_batch_size`` is sent on its own.
+        """
+        groups: dict[tuple[str, str], list[list[int]]] = {}
+        batch_sizes: dict[tuple[str, str], int] = {}
+        for i, request in enumerate(requests):
+            key = (request.model, request.encoding_format)
+            size = len(request.input)
+            batches = groups.setdefault(key, [])
+            if not batches or batch_sizes[key] + size > max_batch_size:
+                batches.append([])
+                batch_sizes[key] = 0
+            batches[-1].append(i)
+            batch_sizes[key] += size
+
+        responses: list[base.EmbeddingResponse | None] = [None] * len(requests)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed_batch(indices: list[int]) -> None:
+            first = requests[indices[0]]
+            merged = base.EmbeddingRequest(
+                model=first.model,
+                input=[item for i in indices for item in requests[i].input],
+                encoding_format=first.encoding_format
+            )
+            async with semaphore:
+                response = await self.embed(merged)
+            if len(response.data) != len(merged.input):
+                raise ProviderError(
+                    f"Expected {len(merged.input)} embeddings in merged "
+                    f"response, got {len(response.data)}",
+                    provider=self.embedding_repo.provider_name
+                )
+            data = sorted(response.data, key=lambda item: item.index)
+
+            offset = 0
+            for i in indices:
+                count = len(requests[i].input)
+                responses[i] = response.model_copy(update={
+                    "data": [
+                        item.model_copy(update={"index": index})
+                        for index, item in enumerate(data[offset:offset + count])
+                    ]
+                })
+                offset += count
+
+        await asyncio.gather(*(
+            _embed_batch(indices)
+            for batches in groups.values()
+            for indices in batches
+        ))
+        return responses
+    
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Get response cache statistics per configured repository.
+
+        ``cost_saved`` counts provider tokens not spent thanks to hits.
+        """
+        repos = {"chat": self.chat_repo, "embeddings": self.embedding_repo}
+        return {
+            name: repo.cache.stats()
+            for name, repo in repos.items()
+            if repo is not None and repo.cache is not None
+        }
+    
+    async def prewarm(self) -> None:
+        """Open provider connections before the first request.
+
+        Await once at application startup.
+        """
+        repos = (self.chat_repo, self.embedding_repo, self.speech_repo)
+        await asyncio.gather(*(repo.prewarm() for repo in repos if repo))
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections on shutdown."""
+        await fetch.close_clients()
@@ -0,0 +1,30 @@
+"""Shared test setup."""
+
+import importlib.util
+import sys
+import types
+
+import pytest
+
+# Application settings come from the deploying service; provide test values
+# when running the package on its own
+if importlib.util.find_spec("lib") is None:
+    settings = types.ModuleType("lib.app.settings")
+    settings.llms = types.SimpleNamespace(
+        anthropic_api_key="test-key",
+        anthropic_version=None,
+        openai_api_key="test-key",
+        openai_org_id=None,
+        gemini_api_key="test-key",
+        gemini_version=None
+    )
+    sys.modules["lib"] = types.ModuleType("lib")
+    sys.modules["lib.app"] = types.ModuleType("lib.app")
+    sys.modules["lib.app.settings"] = settings
+
+@pytest.fixture(autouse=True)
+def _shared_clients():
+    """Drop shared HTTP clients between tests."""
+    import utils.fetch as fetch
+    yield
+    fetch._clients.clear()
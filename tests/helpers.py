@@ -0,0 +1,58 @@
+"""Test doubles for providers and HTTP transport."""
+
+import httpx
+
+import models.base as base
+import models.capabilities as capabilities
+import utils.fetch as fetch
+
+class ChatProvider(capabilities.ChatProvider):
+    """Chat provider forwarding the request as is."""
+
+    def __init__(self, errors: list[str] | None = None):
+        super().__init__(name="test", supported_content_types={base.ContentType.TEXT})
+        self.errors = errors or []
+
+    async def validate_chat_request(self, request):
+        return self.errors
+
+    async def convert_chat_request(self, request):
+        return {"model": request.model, "stream": request.config.stream}
+
+    async def convert_chat_response(self, raw_response, request, raw_body=None):
+        return base.ChatResponse(
+            id="response",
+            content=[{"type": "text", "text": raw_body.decode()}],
+            metadata={"model": request.model}
+        )
+
+    async def convert_chat_stream(self, raw_chunk, request):
+        return base.ChatStreamResponse(
+            id="chunk",
+            delta={"type": "text", "text": raw_chunk.model_dump_json()}
+        )
+
+    async def convert_error(self, error):
+        return error
+
+def mock_transport(base_url: str, handler) -> list[httpx.Request]:
+    """Route the shared client for base_url to handler, returning sent requests."""
+    sent = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return handler(request)
+
+    fetch._clients[base_url] = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler)
+    )
+    return sent
+
+ANTHROPIC_RESPONSE = {
+    "id": "message",
+    "type": "message",
+    "role": "assistant",
+    "content": [{"type": "text", "text": "answer"}],
+    "model": "model",
+    "usage": {"input_tokens": 1, "output_tokens": 1}
+}
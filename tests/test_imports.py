@@ -0,0 +1,19 @@
+"""Smoke tests that repository and service modules import."""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import repositories
+import services
+
+def _modules(package) -> list[str]:
+    return [
+        f"{package.__name__}.{info.name}"
+        for info in pkgutil.iter_modules(package.__path__)
+    ]
+
+@pytest.mark.parametrize("name", _modules(repositories) + _modules(services))
+def test_module_imports(name):
+    importlib.import_module(name)
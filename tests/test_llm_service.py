@@ -0,0 +1,65 @@
+"""Tests for the LLM service."""
+
+import asyncio
+
+import pytest
+
+import models.base as base
+import services.llm as llm
+from exceptions import ProviderError
+
+class EmbeddingRepository:
+    """Embeds each input as its length, optionally dropping the last one."""
+
+    provider_name = "test"
+
+    def __init__(self, drop_last: bool = False):
+        self.drop_last = drop_last
+        self.batches: list[int] = []
+
+    async def embed(self, request):
+        self.batches.append(len(request.input))
+        inputs = request.input[:-1] if self.drop_last else request.input
+        return base.EmbeddingResponse(
+            id="embedding",
+            model=request.model,
+            object="list",
+            usage={},
+            data=[
+                {"index": i, "embedding": [float(len(text))], "object": "embedding"}
+                for i, text in enumerate(inputs)
+            ]
+        )
+
+def _request(*texts: str) -> base.EmbeddingRequest:
+    return base.EmbeddingRequest(model="model", input=list(texts))
+
+def test_embed_batch_splits_merged_results():
+    repo = EmbeddingRepository()
+    service = llm.LLMService(embedding_repo=repo)
+    responses = asyncio.run(service.embed_batch(
+        [_request("a", "bb"), _request("ccc"), _request("dddd", "e")],
+        max_batch_size=3
+    ))
+    assert repo.batches == [3, 2]
+    assert [
+        [item.embedding[0] for item in response.data]
+        for response in responses
+    ] == [[1.0, 2.0], [3.0], [4.0, 1.0]]
+
+def test_embed_batch_rejects_missing_vectors():
+    service = llm.LLMService(embedding_repo=EmbeddingRepository(drop_last=True))
+    with pytest.raises(ProviderError, match="Expected 2 embeddings"):
+        asyncio.run(service.embed_batch([_request("a"), _request("b")]))
+
+def test_unconfigured_operations_raise():
+    service = llm.LLMService()
+
+    async def stream():
+        async for _ in service.stream(None):
+            pass
+
+    with pytest.raises(NotImplementedError, match="Chat completion"):
+        asyncio.run(service.complete(None))
+    with pytest.raises(NotImplementedError, match="Chat streaming"):
+        asyncio.run(stream())
@@ -0,0 +1,17 @@
+"""Tests for universal models."""
+
+import pydantic
+import pytest
+
+import models.base as base
+
+@pytest.mark.parametrize("content", [
+    {"type": "text", "txt": "hello"},
+    {"type": "image", "media": {"type": "image", "mime_type": "image/png", "dta": "QQ=="}},
+])
+def test_request_content_rejects_unknown_keys(content):
+    with pytest.raises(pydantic.ValidationError):
+        base.ChatRequest(
+            model="model",
+            messages=[{"role": "user", "content": [content]}]
+        )
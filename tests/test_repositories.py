@@ -0,0 +1,79 @@
+"""Tests for provider repositories."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+import models.base as base
+import repositories.gemini as gemini
+import repositories.openai as openai
+from exceptions import ValidationError
+from tests import helpers
+
+def _request(model: str = "model") -> base.ChatRequest:
+    return base.ChatRequest(
+        model=model,
+        messages=[{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    )
+
+def test_openai_pool_size():
+    repo = openai.OpenAIChatRepository(helpers.ChatProvider())
+    assert repo.pool_size == 200
+    assert repo.client._transport._pool._max_connections == 200
+
+def test_openai_stream():
+    chunk = {
+        "id": "1",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "model",
+        "choices": [{"index": 0, "delta": {"content": "hi"}}]
+    }
+    body = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+    sent = helpers.mock_transport(
+        openai.OpenAIChatRepository.base_url,
+        lambda request: httpx.Response(200, content=body)
+    )
+    repo = openai.OpenAIChatRepository(helpers.ChatProvider())
+
+    async def collect():
+        return [chunk async for chunk in repo.stream(_request())]
+
+    chunks = asyncio.run(collect())
+    assert len(chunks) == 1
+    assert sent[0].url.path == "/v1/chat/completions"
+    assert json.loads(sent[0].content)["stream"] is True
+
+def test_gemini_url_and_api_key_header():
+    sent = helpers.mock_transport(
+        gemini.GeminiChatRepository.base_url,
+        lambda request: httpx.Response(200, json={"candidates": []})
+    )
+    repo = gemini.GeminiChatRepository(helpers.ChatProvider())
+    asyncio.run(repo.complete(_request("gemini-pro")))
+    assert str(sent[0].url) == (
+        "https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent"
+    )
+    assert sent[0].headers["x-goog-api-key"] == "test-key"
+
+def test_gemini_invalid_request_raises_validation_error():
+    repo = gemini.GeminiChatRepository(helpers.ChatProvider(errors=["bad"]))
+    with pytest.raises(ValidationError, match="Invalid request: bad"):
+        asyncio.run(repo.complete(_request()))
+
+def test_gemini_complete_is_logged(caplog):
+    helpers.mock_transport(
+        gemini.GeminiChatRepository.base_url,
+        lambda request: httpx.Response(200, json={"candidates": []})
+    )
+    repo = gemini.GeminiChatRepository(helpers.ChatProvider())
+    with caplog.at_level(logging.INFO, logger="utils.logging"):
+        asyncio.run(repo.complete(request=_request()))
+    assert [record.message for record in caplog.records] == [
+        "Request details",
+        "Response details",
+        "Request completed",
+    ]
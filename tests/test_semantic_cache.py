@@ -0,0 +1,78 @@
+"""Tests for the semantic chat response cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+import models.base as base
+import repositories.anthropic as anthropic
+import repositories.semantic_cache as semantic_cache
+import utils.cache as cache_utils
+from tests import helpers
+
+class EmbeddingRepository:
+    """Embeds every prompt to the same vector, so any prompt matches."""
+
+    async def embed(self, request):
+        return base.EmbeddingResponse(
+            id="embedding",
+            model=request.model,
+            object="list",
+            usage={},
+            data=[{"index": 0, "embedding": [1.0, 0.0], "object": "embedding"}]
+        )
+
+def _image_request(data: str) -> base.ChatRequest:
+    return base.ChatRequest(
+        model="model",
+        messages=[{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Describe this image"},
+                {
+                    "type": "image",
+                    "media": {"type": "image", "mime_type": "image/png", "data": data}
+                }
+            ]
+        }]
+    )
+
+def test_context_key_includes_last_message_media():
+    key_a = cache_utils.chat_context_key("test", _image_request("QQ=="))
+    key_b = cache_utils.chat_context_key("test", _image_request("Qg=="))
+    assert key_a != key_b
+
+def test_same_prompt_with_other_image_is_not_served_from_cache():
+    sent = helpers.mock_transport(
+        anthropic.AnthropicChatRepository.base_url,
+        lambda request: httpx.Response(200, json=helpers.ANTHROPIC_RESPONSE)
+    )
+    repo = anthropic.AnthropicChatRepository(
+        helpers.ChatProvider(),
+        semantic_cache=semantic_cache.SemanticCache(EmbeddingRepository(), "embed")
+    )
+
+    async def complete_both():
+        await repo.complete(_image_request("QQ=="))
+        await repo.complete(_image_request("Qg=="))
+        await repo.complete(_image_request("QQ=="))
+
+    asyncio.run(complete_both())
+    assert len(sent) == 2
+
+def test_invalid_request_is_not_served_from_cache():
+    helpers.mock_transport(
+        anthropic.AnthropicChatRepository.base_url,
+        lambda request: httpx.Response(200, json=helpers.ANTHROPIC_RESPONSE)
+    )
+    provider = helpers.ChatProvider()
+    repo = anthropic.AnthropicChatRepository(
+        provider,
+        semantic_cache=semantic_cache.SemanticCache(EmbeddingRepository(), "embed")
+    )
+    asyncio.run(repo.complete(_image_request("QQ==")))
+
+    provider.errors = ["bad"]
+    with pytest.raises(ValueError):
+        asyncio.run(repo.complete(_image_request("QQ==")))
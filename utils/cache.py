@@ -0,0 +1,176 @@
+"""Exact-match response cache for LLM requests."""
+
+import collections
+import functools
+import hashlib
+import itertools
+import math
+import time
+import typing
+import unicodedata
+
+import pydantic_core
+
+import models.base as base
+
+# Longest text memoized by normalize_text, so the memo holds repeated
+# system prompts rather than every long conversation turn
+MEMOIZED_TEXT_CHARS = 4096
+
+def _normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text).strip()
+
+_normalize_text_cached = functools.lru_cache(maxsize=1024)(_normalize_text)
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys (NFC, surrounding whitespace trimmed).
+
+    Interior whitespace is kept, as it can be meaningful (e.g. code).
+    Short texts are memoized, as the same system prompt is repeated
+    across most requests.
+    """
+    if len(text) <= MEMOIZED_TEXT_CHARS:
+        return _normalize_text_cached(text)
+    return _normalize_text(text)
+
+def _digest(provider: str, data: typing.Any) -> str:
+    """Hash canonical JSON of request data."""
+    return hashlib.sha256(pydantic_core.to_json([provider, data])).hexdigest()
+
+def _chat_request_data(request: base.ChatRequest) -> dict[str, typing.Any]:
+    """Get request data that determines the answer, with normalized texts."""
+    data = request.model_dump(
+        mode="json",
+        exclude={"config": {"stream"}},
+        exclude_none=True
+    )
+    for message in data["messages"]:
+        for content in message["content"]:
+            if "text" in content:
+                content["text"] = normalize_text(content["text"])
+    return data
+
+def chat_request_key(provider: str, request: base.ChatRequest) -> str:
+    """Get cache key for chat request.
+
+    Streaming flag does not change the answer, so it is not part of the key.
+    """
+    return _digest(provider, _chat_request_data(request))
+
+def chat_context_key(provider: str, request: base.ChatRequest) -> str:
+    """Get cache key for everything in chat request but the last user text.
+
+    Requests that differ only in the text parts of the last user message
+    (system prompt, earlier turns, config and the message's media parts
+    all equal) share the key.
+    """
+    data = _chat_request_data(request)
+    messages = data["messages"]
+    for message in reversed(messages):
+        if message["role"] == "user":
+            message["content"] = [
+                content for content in message["content"]
+                if content["type"] != "text"
+            ]
+            break
+    return _digest(provider, data)
+
+def embedding_request_key(provider: str, request: base.EmbeddingRequest) -> str:
+    """Get cache key for embedding request."""
+    return _digest(provider, request.model_dump(mode="json", exclude_none=True))
+
+class _Entry:
+    """Cached value with eviction bookkeeping."""
+
+    __slots__ = ("value", "expires_at", "cost", "hits")
+
+    def __init__(self, value: typing.Any, expires_at: float, cost: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.cost = cost
+        self.hits = 0
+
+class LRUCache:
+    """Least recently used cache with time to live and cost-aware eviction.
+
+    When full, the ``eviction_sample`` least recently used entries are
+    inspected and the one with the lowest ``cost * (hits + 1)`` is
+    evicted, so expensive or popular responses outlive cheap ones of
+    similar age.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = 3600,
+        eviction_sample: int = 8
+    ):
+        if eviction_sample < 1:
+            raise ValueError("eviction_sample must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.eviction_sample = eviction_sample
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.cost_saved = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> typing.Any | None:
+        """Get cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at < time.monotonic():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self.hits += 1
+        self.cost_saved += entry.cost
+        return entry.value
+
+    def set(self, key: str, value: typing.Any, cost: float = 1.0) -> None:
+        """Cache value, evicting the cheapest of the oldest entries when full.
+
+        ``cost`` is what a miss would spend again, e.g. total tokens.
+        """
+        expires_at = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = _Entry(value, expires_at, cost)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._evict(exclude=key)
+
+    def _evict(self, exclude: str | None = None) -> None:
+        """Evict one entry from the least recently used end.
+
+        ``exclude`` (the key just stored) is only evicted when it is the
+        last entry left.
+        """
+        now = time.monotonic()
+        victim = exclude
+        victim_score = math.inf
+        candidates = (
+            item for item in self._entries.items() if item[0] != exclude
+        )
+        for key, entry in itertools.islice(candidates, self.eviction_sample):
+            score = -1.0 if entry.expires_at < now else entry.cost * (entry.hits + 1)
+            if score < victim_score:
+                victim = key
+                victim_score = score
+        del self._entries[victim]
+
+    def stats(self) -> dict[str, float]:
+        """Get cache usage statistics."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "cost_saved": self.cost_saved,
+        }
@@ -0,0 +1,161 @@
+"""HTTP helpers for provider API calls."""
+
+import importlib.util
+import logging
+import typing
+
+import httpx
+import pydantic
+
+import models.base as base
+
+logger = logging.getLogger(__name__)
+
+ModelT = typing.TypeVar("ModelT", bound=pydantic.BaseModel)
+
+# Server-sent events framing
+SSE_DATA = b"data:"
+SSE_EVENT = b"event:"
+SSE_DONE = b"[DONE]"
+SSE_SKIPPED_EVENTS = frozenset({b"ping"})
+
+DEFAULT_POOL_SIZE = 100
+
+# HTTP/2 multiplexes concurrent requests over one connection per host;
+# httpx needs the optional h2 package (httpx[http2]) for it
+HTTP2 = importlib.util.find_spec("h2") is not None
+_http2_warned = False
+
+# Shared across repositories so connections are kept alive between calls,
+# one client (and so one connection pool) per provider host
+_clients: dict[str, httpx.AsyncClient] = {}
+
+def get_client(
+    host: str = "",
+    pool_size: int = DEFAULT_POOL_SIZE
+) -> httpx.AsyncClient:
+    """Get shared HTTP client for host, creating it on first use.
+
+    ``pool_size`` only applies when the client is created.
+    """
+    global _http2_warned
+    client = _clients.get(host)
+    if client is None or client.is_closed:
+        if not HTTP2 and not _http2_warned:
+            _http2_warned = True
+            logger.warning(
+                "h2 is not installed, provider clients fall back to HTTP/1.1; "
+                "install httpx[http2] to multiplex requests"
+            )
+        client = _clients[host] = httpx.AsyncClient(
+            http2=HTTP2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            ),
+            timeout=httpx.Timeout(120)
+        )
+    return client
+
+async def close_clients() -> None:
+    """Close shared HTTP clients and their pooled connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+def _encode_body(body: typing.Any) -> dict[str, typing.Any]:
+    """Get httpx keyword arguments for request body.
+
+    Bytes are taken as an already serialized JSON body.
+    """
+    if isinstance(body, bytes):
+        return {"content": body}
+    if isinstance(body, pydantic.BaseModel):
+        return {"content": base.dump(body)}
+    return {"json": body}
+
+async def _iter_lines(response: httpx.Response) -> typing.AsyncIterator[bytes]:
+    """Iterate response body lines as bytes, without decoding."""
+    buffer = b""
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if buffer:
+        yield buffer.rstrip(b"\r")
+
+async def make_request(
+    url: str,
+    method: str,
+    headers: typing.Any,
+    body: typing.Any,
+    model: type[ModelT],
+    params: dict[str, str] | None = None,
+    client: httpx.AsyncClient | None = None,
+    return_body: bool = False
+) -> ModelT | tuple[ModelT, bytes]:
+    """Send request to provider API and parse response into model.
+
+    The response is validated straight from the raw body bytes, so there
+    is no intermediate ``json.loads`` and dict walk per call. With
+    ``return_body`` the raw body is returned alongside the model.
+    """
+    if client is None:
+        client = get_client()
+
+    response = await client.request(
+        method,
+        url,
+        headers=headers,
+        params=params,
+        **_encode_body(body)
+    )
+    response.raise_for_status()
+
+    parsed = model.model_validate_json(response.content)
+    if return_body:
+        return parsed, response.content
+    return parsed
+
+async def stream_request(
+    url: str,
+    method: str,
+    headers: typing.Any,
+    body: typing.Any,
+    model: type[ModelT],
+    params: dict[str, str] | None = None,
+    skip_events: frozenset[bytes] = SSE_SKIPPED_EVENTS,
+    client: httpx.AsyncClient | None = None
+) -> typing.AsyncIterator[ModelT]:
+    """Send streaming request and yield each server-sent event as model.
+
+    Lines stay as bytes end to end: event names are matched on the raw
+    prefix and every ``data:`` payload is validated straight from bytes.
+    Payloads of events named in ``skip_events`` are dropped unparsed.
+    """
+    if client is None:
+        client = get_client()
+
+    async with client.stream(
+        method,
+        url,
+        headers=headers,
+        params=params,
+        **_encode_body(body)
+    ) as response:
+        response.raise_for_status()
+
+        event = None
+        async for line in _iter_lines(response):
+            if not line:
+                event = None
+            elif line.startswith(SSE_EVENT):
+                event = line[len(SSE_EVENT):].strip()
+            elif line.startswith(SSE_DATA):
+                data = line[len(SSE_DATA):].strip()
+                if data == SSE_DONE:
+                    return
+                if event not in skip_events:
+                    yield model.model_validate_json(data)
@@ -1,28 +1,49 @@
 """Logging utilities for LLM service."""
 
+import contextvars
 import functools
-import json
+import itertools
 import logging
 import time
 import typing
 import uuid
 
 import pydantic
+import pydantic_core
 
 logger = logging.getLogger(__name__)
 
+# Request IDs are a per-process random prefix plus a counter
+_PROCESS_ID = uuid.uuid4().hex[:12]
+_request_counter = itertools.count(1)
+
+def new_request_id() -> str:
+    """Get process-unique request ID."""
+    return f"{_PROCESS_ID}-{next(_request_counter)}"
+
+# Current request ID, set by RequestLogger for code running inside it
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+SENSITIVE_FIELDS = frozenset({'api_key', 'key', 'token', 'password', 'secret'})
+
 def mask_sensitive_data(data: dict[str, typing.Any]) -> dict[str, typing.Any]:
-    """Mask sensitive data in logs."""
-    SENSITIVE_FIELDS = {'api_key', 'key', 'token', 'password', 'secret'}
+    """Mask sensitive data in logs.
     
-    def _mask_dict(d: dict[str, typing.Any]) -> dict[str, typing.Any]:
-        return {
-            k: '***' if k.lower() in SENSITIVE_FIELDS else 
-               _mask_dict(v) if isinstance(v, dict) else v
-            for k, v in d.items()
-        }
+    Nested dicts are copied as they are visited, so the input is left
+    untouched without recursing per level.
+    """
+    masked = dict(data)
+    stack = [masked]
+    while stack:
+        current = stack.pop()
+        for k, v in current.items():
+            if k.lower() in SENSITIVE_FIELDS:
+                current[k] = '***'
+            elif isinstance(v, dict):
+                current[k] = nested = dict(v)
+                stack.append(nested)
     
-    return _mask_dict(data)
+    return masked
 
 class RequestLogger:
     """Context manager for logging requests and responses."""
@@ -38,18 +59,21 @@ class RequestLogger:
     ):
         self.provider = provider
         self.operation = operation
-        self.request_id = request_id or str(uuid.uuid4())
+        self.request_id = request_id or new_request_id()
         self.log_request = log_request
         self.log_response = log_response
         self.mask_sensitive = mask_sensitive
         self.start_time = None
+        self._token = None
         
     def __enter__(self):
+        self._token = request_id_var.set(self.request_id)
         self.start_time = time.monotonic()
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         duration = time.monotonic() - self.start_time
+        request_id_var.reset(self._token)
         
         if exc_val:
             logger.error(
@@ -74,6 +98,26 @@ class RequestLogger:
                 }
             )
 
+class LazyJSON:
+    """Log field value serialized to JSON only when a handler formats it."""
+    
+    __slots__ = ("data", "mask_sensitive")
+    
+    def __init__(self, data: typing.Any, mask_sensitive: bool = True):
+        self.data = data
+        self.mask_sensitive = mask_sensitive
+        
+    def __str__(self) -> str:
+        if isinstance(self.data, pydantic.BaseModel):
+            data = self.data.model_dump(mode="json")
+        else:
+            data = self.data
+            
+        if self.mask_sensitive:
+            data = mask_sensitive_data(data)
+            
+        return pydantic_core.to_json(data).decode()
+
 def log_request(
     request: typing.Any,
     provider: str,
@@ -81,22 +125,20 @@ def log_request(
     request_id: str | None = None,
     mask_sensitive: bool = True
 ) -> None:
-    """Log request details."""
-    if isinstance(request, pydantic.BaseModel):
-        request_data = request.model_dump()
-    else:
-        request_data = request
-        
-    if mask_sensitive:
-        request_data = mask_sensitive_data(request_data)
+    """Log request details.
+    
+    ``request_id`` defaults to the ID of the enclosing RequestLogger.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
         
     logger.info(
         "Request details",
         extra={
-            "request_id": request_id,
+            "request_id": request_id or request_id_var.get(None),
             "provider": provider,
             "operation": operation,
-            "request": json.dumps(request_data)
+            "request": LazyJSON(request, mask_sensitive)
         }
     )
 
@@ -107,64 +149,57 @@ def log_response(
     request_id: str | None = None,
     mask_sensitive: bool = True
 ) -> None:
-    """Log response details."""
-    if isinstance(response, pydantic.BaseModel):
-        response_data = response.model_dump()
-    else:
-        response_data = response
-        
-    if mask_sensitive:
-        response_data = mask_sensitive_data(response_data)
+    """Log response details.
+    
+    ``request_id`` defaults to the ID of the enclosing RequestLogger.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
         
     logger.info(
         "Response details",
         extra={
-            "request_id": request_id,
+            "request_id": request_id or request_id_var.get(None),
             "provider": provider,
             "operation": operation,
-            "response": json.dumps(response_data)
+            "response": LazyJSON(response, mask_sensitive)
         }
     )
 
 def log_operation(
     provider: str,
     operation: str,
-    log_request: bool = True,
-    log_response: bool = True,
+    log_req: bool = True,
+    log_resp: bool = True,
     mask_sensitive: bool = True
 ) -> typing.Callable:
     """Decorator for logging operations."""
     def decorator(func: typing.Callable) -> typing.Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> typing.Any:
-            request_id = str(uuid.uuid4())
-            
-            if log_request and kwargs.get('request'):
-                log_request(
-                    kwargs['request'],
-                    provider,
-                    operation,
-                    request_id,
-                    mask_sensitive
-                )
-            
             with RequestLogger(
                 provider,
                 operation,
-                request_id,
-                log_request,
-                log_response,
-                mask_sensitive
+                log_request=log_req,
+                log_response=log_resp,
+                mask_sensitive=mask_sensitive
             ):
+                if log_req and kwargs.get('request'):
+                    log_request(
+                        kwargs['request'],
+                        provider,
+                        operation,
+                        mask_sensitive=mask_sensitive
+                    )
+                
                 response = await func(*args, **kwargs)
                 
-                if log_response and response:
+                if log_resp and response:
                     log_response(
                         response,
                         provider,
                         operation,
-                        request_id,
-                        mask_sensitive
+                        mask_sensitive=mask_sensitive
                     )
                 
                 return response